@@ -7,6 +7,7 @@ from flask import Flask, render_template, request, jsonify
 import os
 import re
 import json
+import logging
 import requests
 from requests.auth import HTTPBasicAuth
 from datetime import datetime
@@ -68,7 +69,7 @@ def generate_payload_from_rules():
         live_uuids = data.get('live_uuids', {})
         task_execution = data.get('task_execution', 'parallel')
         
-        logger.info(f"Generate payload request - API: {api_url}, Entity counts: {entity_counts}")
+        logger.info("Generate payload request - API: %s, Entity counts: %s", api_url, entity_counts)
         
         # Log the API request
         logging_manager.log_api_request_response(
@@ -100,26 +101,29 @@ def generate_payload_from_rules():
             scaled_payload = blueprint_generator.fix_blueprint_deployment_references(scaled_payload)
             
             
-        elif storage_manager.get_api_rule_set(api_url):
+        else:
             # Use existing rules to scale payload for other APIs
             rule_set = storage_manager.get_api_rule_set(api_url)
+            if not rule_set:
+                return jsonify({'error': f'No rules found for API: {api_url}'}), 404
+                
             payload_template = rule_set.get('payload_template')
             if not payload_template:
                 return jsonify({'error': f'No payload template found for API: {api_url}'}), 404
                 
-            # Scale the payload using our scaler
+            # Scale the payload using our scaler (the template is re-read from
+            # disk on every request, so mutating the result is safe)
             scaled_payload = payload_scaler.scale_payload(payload_template, entity_counts)
             
-        else:
-            return jsonify({'error': f'No rules found for API: {api_url}'}), 404
-                
         # Apply live UUIDs if provided
-        print(f"Live UUIDs: {live_uuids}")
+        logger.debug("Live UUIDs: %s", live_uuids)
         if live_uuids and any(live_uuids.get(key, {}).get('uuid') for key in live_uuids):
             logger.info(f"Applying live UUIDs to payload: {json.dumps(live_uuids, indent=2)}")
             scaled_payload = live_uuid_processor.apply_live_uuids_to_payload(scaled_payload, live_uuids)
-        logger.info(f"Scaled payload after live UUIDs: {json.dumps(scaled_payload, indent=2)}")
-        logger.info(f"Scaled payload: {json.dumps(scaled_payload, indent=2)}")
+        # Pretty-printing the whole payload is by far the most expensive step
+        # of a large request, so only do it when debug output is wanted
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scaled payload after live UUIDs: %s", json.dumps(scaled_payload, indent=2))
         # Update metadata and spec names
         scaled_payload = payload_scaler.update_metadata_uuid(scaled_payload)
         scaled_payload = payload_scaler.update_spec_name(scaled_payload)
@@ -133,19 +137,23 @@ def generate_payload_from_rules():
         # Save response to history
         storage_manager.save_response_history(api_url, scaled_payload, entity_counts)
         
+        # The repr of the whole payload is both the response's formatted_payload
+        # and the logged size, so build it once
+        formatted_payload = str(scaled_payload)
+        
         # Log successful response
         logging_manager.log_api_request_response(
             api_name='scalar_api_payload_generate',
             endpoint='/api/payload/generate',
             method='POST',
             request_data=data,
-            response_data={'status': 'success', 'payload_size': len(str(scaled_payload))},
+            response_data={'status': 'success', 'payload_size': len(formatted_payload)},
             status_code=200
         )
         
         return jsonify({
             'scaled_payload': scaled_payload,
-            'formatted_payload': str(scaled_payload),
+            'formatted_payload': formatted_payload,
             'entity_counts': entity_counts,
             'api_url': api_url
         })
@@ -236,8 +244,6 @@ def analyze_for_rules():
         
         # Find entities in the payload
         entities = payload_scaler.find_entities_in_payload(payload_data, api_type=api_type)
-        id_values = payload_scaler.collect_all_id_values(payload_data)
-        reference_map = payload_scaler.find_references(payload_data, id_values)
         
         entities_list = []
         for path, info in entities.items():
@@ -363,7 +369,8 @@ def preview_with_rules():
         if not payload_template:
             return jsonify({'error': f'No payload template found for API: {api_url}'}), 404
         
-        # Scale the payload
+        # Scale the payload (the template is re-read from disk on every
+        # request, so mutating the result is safe)
         scaled_payload = payload_scaler.scale_payload(payload_template, entity_counts)
         
         # Apply blueprint-specific fixes if needed
@@ -3,11 +3,15 @@ Blueprint Generator Module
 Handles blueprint-specific generation and hardcoded rules
 """
 
-import copy
-import uuid
+import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+from modules.payload_scaler import make_json_copier, new_uuid_batch
+
+# Names for the first substrates of a generated blueprint; later ones are VM<n>
+SUBSTRATE_VM_NAMES = ("VM1", "VM2", "VM1_3", "VM2_4", "VM5", "VM6", "VM7", "VM8", "VM9", "VM10")
+
 
 class BlueprintGenerator:
     """Handles blueprint-specific generation logic and hardcoded rules"""
@@ -32,8 +36,9 @@ class BlueprintGenerator:
         if not resources:
             return data
             
-        # Get current counts
-        service_count = len(resources.get('service_definition_list', []))
+        # Get current counts; the entity lists are looked up once and reused
+        service_list = resources.get('service_definition_list', [])
+        service_count = len(service_list)
         app_profile_list = resources.get('app_profile_list', [])
         app_profile_count = len(app_profile_list)
         
@@ -48,8 +53,8 @@ class BlueprintGenerator:
             current_deployment_count = len(current_deployments)
             
             if current_deployment_count > service_count:
-                # Remove excess deployments
-                app_profile['deployment_create_list'] = current_deployments[:service_count]
+                # Remove excess deployments in place
+                del current_deployments[service_count:]
                 
         # RULE 2: Packages = App Profiles × Services (same as substrates)
         expected_package_count = app_profile_count * service_count
@@ -59,35 +64,41 @@ class BlueprintGenerator:
         
         if current_package_count > expected_package_count:
             # Remove excess packages
-            resources['package_definition_list'] = package_list[:expected_package_count]
+            del package_list[expected_package_count:]
             
         elif current_package_count < expected_package_count:
             # Add more packages
             if package_list:
-                template_package = copy.deepcopy(package_list[0])
-                service_list = resources.get('service_definition_list', [])
-                service_uuids = [s.get('uuid') for s in service_list if s.get('uuid')]
+                # Serialize the template once; each new package is decoded from it
+                copy_template_package = make_json_copier(package_list[0])
+                service_uuids = self.get_entity_uuids(service_list)
+                service_uuid_count = len(service_uuids)
                 
-                for i in range(expected_package_count - current_package_count):
-                    new_package = copy.deepcopy(template_package)
-                    new_package['uuid'] = str(uuid.uuid4())
-                    
-                    # Calculate which service this package should point to (cycling)
-                    global_package_index = current_package_count + i
-                    service_index = global_package_index % service_count
+                # Packages cycle through the services
+                service_index = current_package_count % service_count
+                
+                # Draw the randomness for every new package in one call
+                new_package_uuids = new_uuid_batch(expected_package_count - current_package_count)
+                for global_package_index, new_package_uuid in enumerate(new_package_uuids, current_package_count):
+                    new_package = copy_template_package()
+                    new_package['uuid'] = new_package_uuid
                     new_package['name'] = f"Package{global_package_index + 1}"
                     
                     # Update service_local_reference_list to point to the correct service
-                    if service_uuids and service_index < len(service_uuids):
+                    if service_index < service_uuid_count:
                         target_service_uuid = service_uuids[service_index]
                         if 'service_local_reference_list' in new_package:
                             for ref in new_package['service_local_reference_list']:
                                 if ref.get('kind') == 'app_service':
                                     ref['uuid'] = target_service_uuid
-                        self.logger.info(f"Package{global_package_index + 1} -> Service {service_index + 1} (UUID: {target_service_uuid})")
+                        self.logger.info("Package%d -> Service %d (UUID: %s)", global_package_index + 1, service_index + 1, target_service_uuid)
                     
                     package_list.append(new_package)
                     
+                    service_index += 1
+                    if service_index == service_count:
+                        service_index = 0
+                    
         # RULE 3: Substrates = App Profiles × Services
         expected_substrate_count = app_profile_count * service_count
         self.logger.info(f"RULE 3: Setting Substrates = App Profiles × Services ({app_profile_count} × {service_count} = {expected_substrate_count})")
@@ -97,21 +108,33 @@ class BlueprintGenerator:
         
         if current_substrate_count > expected_substrate_count:
             # Remove excess substrates
-            resources['substrate_definition_list'] = substrate_list[:expected_substrate_count]
+            del substrate_list[expected_substrate_count:]
             
         elif current_substrate_count < expected_substrate_count:
             # Add more substrates
             if substrate_list:
-                template_substrate = copy.deepcopy(substrate_list[0])
-                for i in range(expected_substrate_count - current_substrate_count):
-                    new_substrate = copy.deepcopy(template_substrate)
-                    new_substrate['uuid'] = str(uuid.uuid4())
+                copy_template_substrate = make_json_copier(substrate_list[0])
+                new_substrate_uuids = new_uuid_batch(expected_substrate_count - current_substrate_count)
+                for i, new_substrate_uuid in enumerate(new_substrate_uuids):
+                    new_substrate = copy_template_substrate()
+                    new_substrate['uuid'] = new_substrate_uuid
                     new_substrate['name'] = f"VM1_{current_substrate_count + i + 1}"
                     substrate_list.append(new_substrate)
                     
-        self.logger.info(f"HARDCODED RULES APPLIED - Final counts: Services={len(resources.get('service_definition_list', []))}, App Profiles={len(resources.get('app_profile_list', []))}, Packages={len(resources.get('package_definition_list', []))}, Substrates={len(resources.get('substrate_definition_list', []))}, Credentials={len(resources.get('credential_definition_list', []))}")
+        # Packages and substrates were trimmed or extended in place, so the
+        # local lists already hold the final counts
+        self.logger.info(f"HARDCODED RULES APPLIED - Final counts: Services={service_count}, App Profiles={app_profile_count}, Packages={len(package_list)}, Substrates={len(substrate_list)}, Credentials={len(resources.get('credential_definition_list', []))}")
         return data
         
+    def get_entity_uuids(self, entities: List[Dict[str, Any]]) -> List[str]:
+        """Get the non-empty UUIDs of a list of entities, in order"""
+        entity_uuids = []
+        for entity in entities:
+            entity_uuid = entity.get('uuid')
+            if entity_uuid:
+                entity_uuids.append(entity_uuid)
+        return entity_uuids
+        
     def fix_blueprint_deployment_references(self, data: Any) -> Any:
         """
         Fix blueprint deployment references to ensure proper UUID mapping.
@@ -137,68 +160,60 @@ class BlueprintGenerator:
             return data
             
         # STEP 2: Continue with UUID mapping (hardcoded rules already applied)
-        service_count = len(resources.get('service_definition_list', []))
+        service_list = resources.get('service_definition_list', [])
+        package_list = resources.get('package_definition_list', [])
+        service_count = len(service_list)
         app_profile_list = resources.get('app_profile_list', [])
         app_profile_count = len(app_profile_list)
         
         self.logger.info(f"DEBUG: After hardcoded rules - Service count: {service_count}, App profile count: {app_profile_count}")
         
         # Get all entity UUIDs in order
-        substrate_uuids = [s.get('uuid') for s in resources.get('substrate_definition_list', []) if s.get('uuid')]
-        package_uuids = [p.get('uuid') for p in resources.get('package_definition_list', []) if p.get('uuid')]
-        service_uuids = [s.get('uuid') for s in resources.get('service_definition_list', []) if s.get('uuid')]
+        substrate_uuids = self.get_entity_uuids(resources.get('substrate_definition_list', []))
+        package_uuids = self.get_entity_uuids(package_list)
+        service_uuids = self.get_entity_uuids(service_list)
         
         self.logger.info(f"DEBUG: fix_blueprint_deployment_references - substrate_uuids: {substrate_uuids}")
         self.logger.info(f"DEBUG: fix_blueprint_deployment_references - package_uuids: {package_uuids}")
         self.logger.info(f"DEBUG: fix_blueprint_deployment_references - service_uuids: {service_uuids}")
         
-        # Debug: Check current deployment references BEFORE fixing
+        # Deployment i takes the i-th substrate/package when there is one
+        deployment_lists = [app_profile.get('deployment_create_list', []) for app_profile in app_profile_list]
+        deployment_count = sum(len(deployments) for deployments in deployment_lists)
+        substrate_for_deployment = substrate_uuids[:deployment_count] + [None] * (deployment_count - len(substrate_uuids))
+        package_for_deployment = package_uuids[:deployment_count] + [None] * (deployment_count - len(package_uuids))
+        log_info = self.logger.isEnabledFor(logging.INFO)
         deployment_index = 0
-        for profile_idx, app_profile in enumerate(app_profile_list):
-            deployments = app_profile.get('deployment_create_list', [])
-            self.logger.info(f"DEBUG: Profile {profile_idx + 1} has {len(deployments)} deployments")
+        for profile_idx, deployments in enumerate(deployment_lists):
+            self.logger.info("DEBUG: Profile %d has %d deployments", profile_idx + 1, len(deployments))
             
-            for dep_idx, deployment in enumerate(deployments):
-                current_substrate_ref = deployment.get('substrate_local_reference', {}).get('uuid', 'None')
-                current_package_refs = [ref.get('uuid', 'None') for ref in deployment.get('package_local_reference_list', [])]
-                self.logger.info(f"DEBUG: BEFORE - Deployment {deployment_index + 1}: substrate={current_substrate_ref}, packages={current_package_refs}")
-                deployment_index += 1
+            for deployment in deployments:
+                if log_info:
+                    current_substrate_ref = deployment.get('substrate_local_reference', {}).get('uuid', 'None')
+                    current_package_refs = [ref.get('uuid', 'None') for ref in deployment.get('package_local_reference_list', [])]
+                    self.logger.info("DEBUG: BEFORE - Deployment %d: substrate=%s, packages=%s", deployment_index + 1, current_substrate_ref, current_package_refs)
                 
-        # Fix deployment references (distribute entities across deployments)
-        deployment_index = 0
-        for profile_idx, app_profile in enumerate(app_profile_list):
-            deployments = app_profile.get('deployment_create_list', [])
-            
-            for dep_idx, deployment in enumerate(deployments):
                 # Each deployment gets a unique substrate and package
-                if deployment_index < len(substrate_uuids):
-                    deployment['substrate_local_reference'] = {
-                        'kind': 'app_substrate',
-                        'uuid': substrate_uuids[deployment_index]
-                    }
+                substrate_uuid = substrate_for_deployment[deployment_index]
+                package_uuid = package_for_deployment[deployment_index]
+                if substrate_uuid is not None:
+                    deployment['substrate_local_reference'] = {'kind': 'app_substrate', 'uuid': substrate_uuid}
+                if package_uuid is not None:
+                    deployment['package_local_reference_list'] = [{'kind': 'app_package', 'uuid': package_uuid}]
                     
-                if deployment_index < len(package_uuids):
-                    deployment['package_local_reference_list'] = [{
-                        'kind': 'app_package',
-                        'uuid': package_uuids[deployment_index]
-                    }]
-                    
-                self.logger.info(f"DEBUG: AFTER - Deployment {deployment_index + 1}: substrate={substrate_uuids[deployment_index] if deployment_index < len(substrate_uuids) else 'None'}, package={package_uuids[deployment_index] if deployment_index < len(package_uuids) else 'None'}")
+                self.logger.info("DEBUG: AFTER - Deployment %d: substrate=%s, package=%s", deployment_index + 1, substrate_uuid, package_uuid)
                 deployment_index += 1
                 
         # Fix package-to-service references (distribute packages across services)
         if service_uuids and package_uuids:
-            package_list = resources.get('package_definition_list', [])
             self.logger.info(f"DEBUG: Total packages in package_definition_list: {len(package_list)}")
             self.logger.info(f"DEBUG: Expected package_uuids count: {len(package_uuids)}")
             
+            # Packages cycle through the services
+            service_index = 0
+            service_uuid_count = len(service_uuids)
             for i, package in enumerate(package_list):
-                if i < len(service_uuids):
-                    # Direct 1:1 mapping for first N packages
-                    target_service_uuid = service_uuids[i]
-                else:
-                    # Round-robin for remaining packages
-                    target_service_uuid = service_uuids[i % len(service_uuids)]
+                target_service_uuid = service_uuids[service_index]
                     
                 # Update service_local_reference_list
                 if 'service_local_reference_list' in package:
@@ -206,30 +221,23 @@ class BlueprintGenerator:
                         if ref.get('kind') == 'app_service':
                             ref['uuid'] = target_service_uuid
                             
-                self.logger.info(f"DEBUG: Package {i + 1} -> Service {(i % len(service_uuids)) + 1} (UUID: {target_service_uuid})")
+                self.logger.info("DEBUG: Package %d -> Service %d (UUID: %s)", i + 1, service_index + 1, target_service_uuid)
+                
+                service_index += 1
+                if service_index == service_uuid_count:
+                    service_index = 0
                 
         # Add all deployment UUIDs to client_attrs with grid positioning
         # Only update client_attrs if it doesn't exist or is empty
-        if 'client_attrs' not in resources or not resources['client_attrs']:
-            resources['client_attrs'] = {}
-            deployment_count = 0
-            
-            for app_profile in app_profile_list:
-                for deployment in app_profile.get('deployment_create_list', []):
-                    deployment_uuid = deployment.get('uuid')
-                    if deployment_uuid:
-                        # Calculate grid position (10 deployments per row)
-                        # row = deployment_count // 10
-                        # col = deployment_count % 10
-                        x_pos = deployment_count * 120  # 10, 20, 30, 40...
-                        y_pos = int(deployment_count/10) * 120  # 10 for first row, 20 for second row...
-                        
-                        resources['client_attrs'][deployment_uuid] = {
-                            "x": x_pos,
-                            "y": y_pos
-                        }
-                        self.logger.info(f"DEBUG: Added deployment {deployment_count} UUID {deployment_uuid} to client_attrs at position ({x_pos}, {y_pos})")
-                        deployment_count += 1
+        if not resources.get('client_attrs'):
+            # Grid position: 120 apart along x, a new 120-high row every 10 deployments
+            deployment_uuids = (deployment['uuid'] for deployments in deployment_lists
+                                for deployment in deployments if deployment.get('uuid'))
+            resources['client_attrs'] = {
+                deployment_uuid: {"x": i * 120, "y": (i // 10) * 120}
+                for i, deployment_uuid in enumerate(deployment_uuids)
+            }
+            self.logger.info("DEBUG: Added %d deployment UUIDs to client_attrs", len(resources['client_attrs']))
         else:
             self.logger.info("DEBUG: client_attrs already exists, skipping regeneration")
                     
@@ -245,20 +253,19 @@ class BlueprintGenerator:
             blueprint_name = f"st_bp_gen_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         
         # Generate UUIDs
-        blueprint_uuid = str(uuid.uuid4())
-        credential_uuid = str(uuid.uuid4())
+        blueprint_uuid, credential_uuid = new_uuid_batch(2)
         
         # Calculate total entities needed
         total_packages = app_profiles_count * services_count
         total_substrates = app_profiles_count * services_count
         total_deployments = app_profiles_count * services_count
         
-        # Generate UUIDs for all entities
-        service_uuids = [str(uuid.uuid4()) for _ in range(services_count)]
-        substrate_uuids = [str(uuid.uuid4()) for _ in range(total_substrates)]
-        package_uuids = [str(uuid.uuid4()) for _ in range(total_packages)]
-        deployment_uuids = [str(uuid.uuid4()) for _ in range(total_deployments)]
-        app_profile_uuids = [str(uuid.uuid4()) for _ in range(app_profiles_count)]
+        # Generate UUIDs for all entities (one random read per list)
+        service_uuids = new_uuid_batch(services_count)
+        substrate_uuids = new_uuid_batch(total_substrates)
+        package_uuids = new_uuid_batch(total_packages)
+        deployment_uuids = new_uuid_batch(total_deployments)
+        app_profile_uuids = new_uuid_batch(app_profiles_count)
         
         self.logger.info(f"Generated UUIDs - Services: {len(service_uuids)}, Substrates: {len(substrate_uuids)}, Packages: {len(package_uuids)}, Deployments: {len(deployment_uuids)}, Profiles: {len(app_profile_uuids)}")
         
@@ -308,69 +315,55 @@ class BlueprintGenerator:
             }
         }
         
-        # Create services
-        self.logger.info(f"Creating {services_count} services...")
-        for i in range(services_count):
-            service = self.create_service_definition(i + 1, service_uuids[i])
-            blueprint["spec"]["resources"]["service_definition_list"].append(service)
-            self.logger.info(f"Successfully created service: {service.get('name')}")
-            
-        # Create substrates
-        self.logger.info(f"Creating {total_substrates} substrates...")
-        substrate_index = 0
-        for profile_idx in range(app_profiles_count):
-            for service_idx in range(services_count):
-                try:
-                    self.logger.info(f"Creating substrate {substrate_index+1}/{total_substrates} (profile {profile_idx+1}, service {service_idx+1})")
-                    if substrate_index >= len(substrate_uuids):
-                        raise IndexError(f"Substrate index {substrate_index} out of range. Available UUIDs: {len(substrate_uuids)}")
-                    
+        # Bind the entity lists once; the loops below append to them directly
+        resources = blueprint["spec"]["resources"]
+        service_list = resources["service_definition_list"]
+        substrate_list = resources["substrate_definition_list"]
+        package_list = resources["package_definition_list"]
+        app_profile_list = resources["app_profile_list"]
+        
+        # The UUID lists above are sized from the same counts the loops below
+        # use, so the loops index them directly; the handler logs which stage
+        # failed
+        stage = "services"
+        try:
+            # Create services
+            self.logger.info(f"Creating {services_count} services...")
+            for i in range(services_count):
+                service = self.create_service_definition(i + 1, service_uuids[i])
+                service_list.append(service)
+                
+            # Create substrates
+            stage = "substrates"
+            self.logger.info(f"Creating {total_substrates} substrates...")
+            substrate_index = 0
+            for profile_idx in range(app_profiles_count):
+                for service_idx in range(services_count):
                     substrate = self.create_substrate_definition(substrate_index, substrate_uuids[substrate_index], credential_uuid)
-                    blueprint["spec"]["resources"]["substrate_definition_list"].append(substrate)
-                    self.logger.info(f"Successfully created substrate: {substrate.get('name')}")
+                    substrate_list.append(substrate)
                     substrate_index += 1
-                except Exception as e:
-                    self.logger.error(f"Error creating substrate {substrate_index+1}: {str(e)}")
-                    raise
-                    
-        # Create packages
-        self.logger.info(f"Creating {total_packages} packages...")
-        package_index = 0
-        for profile_idx in range(app_profiles_count):
-            for service_idx in range(services_count):
-                try:
-                    self.logger.info(f"Creating package {package_index+1}/{total_packages} (profile {profile_idx+1}, service {service_idx+1})")
-                    if package_index >= len(package_uuids):
-                        raise IndexError(f"Package index {package_index} out of range. Available UUIDs: {len(package_uuids)}")
-                    if service_idx >= len(service_uuids):
-                        raise IndexError(f"Service index {service_idx} out of range. Available UUIDs: {len(service_uuids)}")
-                    
+                
+            # Create packages
+            stage = "packages"
+            self.logger.info(f"Creating {total_packages} packages...")
+            package_index = 0
+            for profile_idx in range(app_profiles_count):
+                for service_idx in range(services_count):
                     # Each package references exactly ONE service (1:1 mapping)
                     package = self.create_package_definition(package_index + 1, package_uuids[package_index], service_uuids[service_idx])
-                    blueprint["spec"]["resources"]["package_definition_list"].append(package)
-                    self.logger.info(f"Successfully created package: {package.get('name')} -> Service UUID: {service_uuids[service_idx]}")
+                    package_list.append(package)
                     package_index += 1
-                except Exception as e:
-                    self.logger.error(f"Error creating package {package_index+1}: {str(e)}")
-                    raise
                     
-        # Create app profiles with deployments
-        self.logger.info(f"Creating {app_profiles_count} app profiles...")
-        deployment_index = 0
-        for profile_idx in range(app_profiles_count):
-            try:
+            # Create app profiles with deployments
+            stage = "app profiles"
+            self.logger.info(f"Creating {app_profiles_count} app profiles...")
+            deployment_index = 0
+            for profile_idx in range(app_profiles_count):
                 profile_name = "Default" if profile_idx == 0 else f"Profile {profile_idx + 1}"
                 
                 # Create deployments for this profile
                 deployments = []
                 for service_idx in range(services_count):
-                    if deployment_index >= len(deployment_uuids):
-                        raise IndexError(f"Deployment index {deployment_index} out of range. Available UUIDs: {len(deployment_uuids)}")
-                    if deployment_index >= len(substrate_uuids):
-                        raise IndexError(f"Substrate index {deployment_index} out of range for deployment. Available UUIDs: {len(substrate_uuids)}")
-                    if deployment_index >= len(package_uuids):
-                        raise IndexError(f"Package index {deployment_index} out of range for deployment. Available UUIDs: {len(package_uuids)}")
-                        
                     deployment = self.create_deployment_definition(
                         deployment_index + 1,
                         deployment_uuids[deployment_index],
@@ -378,86 +371,40 @@ class BlueprintGenerator:
                         package_uuids[deployment_index]
                     )
                     deployments.append(deployment)
-                    self.logger.info(f"Created deployment {deployment_index + 1} for profile {profile_idx + 1}")
                     deployment_index += 1
                     
                 # Create app profile
                 app_profile = self.create_app_profile_definition(profile_name, app_profile_uuids[profile_idx], deployments)
-                blueprint["spec"]["resources"]["app_profile_list"].append(app_profile)
-                self.logger.info(f"Successfully created app profile: {profile_name}")
-                
-            except Exception as e:
-                self.logger.error(f"Error creating app profile {profile_idx+1}: {str(e)}")
-                raise
-                
-        # Add client_attrs for deployments (grid positioning)
-        client_attrs = {}
-        for i, deployment_uuid in enumerate(deployment_uuids):
-            # Calculate grid position (10 deployments per row)
-            row = i // 10
-            col = i % 10
-            x_pos = (col + 1) * 10  # 10, 20, 30, 40...
-            y_pos = (row + 1) * 10  # 10 for first row, 20 for second row...
-            
-            client_attrs[deployment_uuid] = {
-                "x": x_pos,
-                "y": y_pos
-            }
+                app_profile_list.append(app_profile)
+        except Exception as e:
+            self.logger.error(f"Error creating {stage}: {str(e)}")
+            raise
             
-        blueprint["spec"]["resources"]["client_attrs"] = client_attrs
+        # Add client_attrs for deployments (grid positioning, 10 deployments per row):
+        # x is 10, 20, 30... along a row and y is 10 for the first row, 20 for the second...
+        resources["client_attrs"] = {
+            deployment_uuid: {"x": (i % 10 + 1) * 10, "y": (i // 10 + 1) * 10}
+            for i, deployment_uuid in enumerate(deployment_uuids)
+        }
         
         self.logger.info(f"Blueprint generation completed successfully!")
-        self.logger.info(f"Final counts - Services: {len(blueprint['spec']['resources']['service_definition_list'])}, Substrates: {len(blueprint['spec']['resources']['substrate_definition_list'])}, Packages: {len(blueprint['spec']['resources']['package_definition_list'])}, App Profiles: {len(blueprint['spec']['resources']['app_profile_list'])}")
+        self.logger.info(f"Final counts - Services: {len(service_list)}, Substrates: {len(substrate_list)}, Packages: {len(package_list)}, App Profiles: {len(app_profile_list)}")
         
         return blueprint
         
     def create_service_definition(self, index: int, service_uuid: str) -> Dict[str, Any]:
         """Create a service definition with all required actions"""
-        try:
-            self.logger.info(f"Creating service definition: index={index}, uuid={service_uuid}")
-            actions = []
-            action_names = ["action_create", "action_delete", "action_start", "action_stop", "action_restart"]
-            self.logger.info(f"Will create {len(action_names)} actions for service {index}")
-        except Exception as e:
-            self.logger.error(f"Error in create_service_definition: index={index}, error={str(e)}")
-            raise
+        action_names = ["action_create", "action_delete", "action_start", "action_stop", "action_restart"]
         
-        for action_name in action_names:
-            runbook_uuid = str(uuid.uuid4())
-            task_uuid = str(uuid.uuid4())
-            action_uuid = str(uuid.uuid4())
-            
-            action = {
+        actions = [
+            {
                 "name": action_name,
-                "runbook": {
-                    "name": f"{action_name}_{index}_runbook",
-                    "variable_list": [],
-                    "main_task_local_reference": {
-                        "kind": "app_task",
-                        "uuid": task_uuid
-                    },
-                    "task_definition_list": [
-                        {
-                            "name": f"{action_name}_{index}_dag",
-                            "target_any_local_reference": {
-                                "kind": "app_service",
-                                "uuid": service_uuid
-                            },
-                            "variable_list": [],
-                            "child_tasks_local_reference_list": [],
-                            "type": "DAG",
-                            "attrs": {
-                                "edges": []
-                            },
-                            "uuid": task_uuid
-                        }
-                    ],
-                    "uuid": runbook_uuid
-                },
+                "runbook": self.create_dag_runbook(f"{action_name}_{index}", "app_service", service_uuid),
                 "type": "system",
                 "uuid": action_uuid
             }
-            actions.append(action)
+            for action_name, action_uuid in zip(action_names, new_uuid_batch(len(action_names)))
+        ]
         
         return {
             "name": f"Service{index}",
@@ -468,15 +415,39 @@ class BlueprintGenerator:
             "uuid": service_uuid
         }
         
+    def create_dag_runbook(self, name_prefix: str, target_kind: str, target_uuid: str) -> Dict[str, Any]:
+        """Create a runbook whose main task is an empty DAG targeting the given entity"""
+        runbook_uuid, task_uuid = new_uuid_batch(2)
+        
+        return {
+            "name": f"{name_prefix}_runbook",
+            "variable_list": [],
+            "main_task_local_reference": {
+                "kind": "app_task",
+                "uuid": task_uuid
+            },
+            "task_definition_list": [
+                {
+                    "name": f"{name_prefix}_dag",
+                    "target_any_local_reference": {
+                        "kind": target_kind,
+                        "uuid": target_uuid
+                    },
+                    "variable_list": [],
+                    "child_tasks_local_reference_list": [],
+                    "type": "DAG",
+                    "attrs": {
+                        "edges": []
+                    },
+                    "uuid": task_uuid
+                }
+            ],
+            "uuid": runbook_uuid
+        }
+        
     def create_substrate_definition(self, index: int, substrate_uuid: str, credential_uuid: str) -> Dict[str, Any]:
         """Create a substrate definition"""
-        try:
-            vm_names = ["VM1", "VM2", "VM1_3", "VM2_4", "VM5", "VM6", "VM7", "VM8", "VM9", "VM10"]  # Extended list
-            vm_name = vm_names[index] if index < len(vm_names) else f"VM{index + 1}"
-            self.logger.info(f"Creating substrate definition: index={index}, name={vm_name}, uuid={substrate_uuid}")
-        except Exception as e:
-            self.logger.error(f"Error in create_substrate_definition: index={index}, error={str(e)}")
-            raise
+        vm_name = SUBSTRATE_VM_NAMES[index] if index < len(SUBSTRATE_VM_NAMES) else f"VM{index + 1}"
         
         return {
             "variable_list": [],
@@ -547,65 +518,12 @@ class BlueprintGenerator:
         
     def create_package_definition(self, index: int, package_uuid: str, service_uuid: str) -> Dict[str, Any]:
         """Create a package definition with correct service UUID mapping"""
-        install_runbook_uuid = str(uuid.uuid4())
-        install_task_uuid = str(uuid.uuid4())
-        uninstall_runbook_uuid = str(uuid.uuid4())
-        uninstall_task_uuid = str(uuid.uuid4())
-        
         return {
             "type": "DEB",
             "variable_list": [],
             "options": {
-                "install_runbook": {
-                    "name": f"install_{index}_runbook",
-                    "variable_list": [],
-                    "main_task_local_reference": {
-                        "kind": "app_task",
-                        "uuid": install_task_uuid
-                    },
-                    "task_definition_list": [
-                        {
-                            "name": f"install_{index}_dag",
-                            "target_any_local_reference": {
-                                "kind": "app_package",
-                                "uuid": package_uuid
-                            },
-                            "variable_list": [],
-                            "child_tasks_local_reference_list": [],
-                            "type": "DAG",
-                            "attrs": {
-                                "edges": []
-                            },
-                            "uuid": install_task_uuid
-                        }
-                    ],
-                    "uuid": install_runbook_uuid
-                },
-                "uninstall_runbook": {
-                    "name": f"uninstall_{index}_runbook",
-                    "variable_list": [],
-                    "main_task_local_reference": {
-                        "kind": "app_task",
-                        "uuid": uninstall_task_uuid
-                    },
-                    "task_definition_list": [
-                        {
-                            "name": f"uninstall_{index}_dag",
-                            "target_any_local_reference": {
-                                "kind": "app_package",
-                                "uuid": package_uuid
-                            },
-                            "variable_list": [],
-                            "child_tasks_local_reference_list": [],
-                            "type": "DAG",
-                            "attrs": {
-                                "edges": []
-                            },
-                            "uuid": uninstall_task_uuid
-                        }
-                    ],
-                    "uuid": uninstall_runbook_uuid
-                }
+                "install_runbook": self.create_dag_runbook(f"install_{index}", "app_package", package_uuid),
+                "uninstall_runbook": self.create_dag_runbook(f"uninstall_{index}", "app_package", package_uuid)
             },
             "service_local_reference_list": [
                 {
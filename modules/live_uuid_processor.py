@@ -3,7 +3,6 @@ Live UUID Processor Module
 Handles applying live UUIDs from Nutanix PC to generated payloads
 """
 
-import copy
 import json
 from typing import Dict, Any
 
@@ -18,12 +17,14 @@ class LiveUuidProcessor:
         """
         Apply live UUIDs to the generated payload.
         
+        The payload is updated in place.
+        
         Args:
             payload: The generated payload
             live_uuids: Dictionary containing live UUIDs from PC
             
         Returns:
-            Modified payload with live UUIDs applied
+            The same payload with live UUIDs applied
         """
         if not isinstance(payload, dict) or not live_uuids:
             self.logger.info("No payload or live UUIDs provided, skipping UUID application")
@@ -31,8 +32,7 @@ class LiveUuidProcessor:
         
         self.logger.info(f"Applying live UUIDs to payload: {json.dumps(live_uuids, indent=2)}")
         
-        # Make a deep copy to avoid modifying the original
-        modified_payload = copy.deepcopy(payload)
+        modified_payload = payload
         
         # Apply project reference if available
         if live_uuids.get('project', {}).get('uuid'):
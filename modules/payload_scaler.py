@@ -3,11 +3,130 @@ Payload Scaler Module
 Core scaling logic and payload transformations
 """
 
-import copy
-import uuid
+import math
+import os
 import re
+from functools import lru_cache
 from datetime import datetime
-from typing import Dict, List, Any, Set, Optional
+from typing import Dict, List, Any, Set, Optional, Tuple, Callable
+
+try:
+    import orjson
+except ImportError:  # optional: make_json_copier falls back to a pure-Python copy
+    orjson = None
+
+
+# Single pattern equivalent to trying r'.*_?id$', r'.*_?uuid$', r'.*_?guid$',
+# r'.*_?key$', r'^id$', r'^uuid$', r'^guid$' and r'^key$' one after another
+ID_FIELD_PATTERN = re.compile(r'.*(?:_?id|_?uuid|_?guid|_?key)$', re.IGNORECASE)
+
+UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE)
+
+# Suffix that update_spec_name appends, e.g. "_20240101_120000"
+SPEC_NAME_TIMESTAMP_PATTERN = re.compile(r'_\d{8}_\d{6}$')
+
+
+@lru_cache(maxsize=4096)
+def _is_uuid_string(value: str) -> bool:
+    # The same UUID shows up once as an entity and again in every reference to it
+    return UUID_PATTERN.match(value) is not None
+
+
+@lru_cache(maxsize=4096)
+def _is_id_field_name(field_name: str) -> bool:
+    # Payloads reuse a small set of key names, so after warm-up each check is
+    # one cache lookup
+    return ID_FIELD_PATTERN.match(field_name) is not None
+
+
+@lru_cache(maxsize=512)
+def _split_path(path: str) -> Tuple[str, ...]:
+    # Entity paths come from a small, static rule set, so split each one once
+    return tuple(path.split('.'))
+
+
+# Byte translation tables that stamp the version 4 nibble (byte 6) and the
+# RFC 4122 variant bits 10xx (byte 8) onto random bytes, as uuid.uuid4() does
+_UUID_VERSION_BYTES = bytes((byte & 0x0f) | 0x40 for byte in range(256))
+_UUID_VARIANT_BYTES = bytes((byte & 0x3f) | 0x80 for byte in range(256))
+
+
+def new_uuid_batch(count: int) -> List[str]:
+    """Generate count random (version 4) UUID strings from a single os.urandom call"""
+    # Like range(), a negative count yields no UUIDs
+    count = max(count, 0)
+    raw = bytearray(os.urandom(16 * count))
+    # Fix the version and variant bytes of every UUID with two C-level slices
+    raw[6::16] = raw[6::16].translate(_UUID_VERSION_BYTES)
+    raw[8::16] = raw[8::16].translate(_UUID_VARIANT_BYTES)
+    hex_digits = raw.hex()
+    return [f"{hex_digits[start:start + 8]}-{hex_digits[start + 8:start + 12]}-{hex_digits[start + 12:start + 16]}-"
+            f"{hex_digits[start + 16:start + 20]}-{hex_digits[start + 20:start + 32]}"
+            for start in range(0, 32 * count, 32)]
+
+
+JSON_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# Payloads come straight from json.loads, so containers are exactly dict or
+# list and the walkers below can test type() identity instead of isinstance()
+JSON_CONTAINER_TYPES = frozenset({dict, list})
+
+
+def is_scalar_list(value: List) -> bool:
+    """Check if a list holds only JSON scalars (type check runs in C and stops at the first container)"""
+    return JSON_SCALAR_TYPES.issuperset(map(type, value))
+
+
+def copy_json(value: Any) -> Any:
+    """Copy a JSON-shaped value (dicts, lists and immutable scalars)"""
+    value_type = type(value)
+    if value_type is dict:
+        return {key: copy_json(item) for key, item in value.items()}
+    if value_type is list:
+        if is_scalar_list(value):
+            # Nothing to recurse into, copy the whole list in one C call
+            return value[:]
+        return [copy_json(item) for item in value]
+    return value
+
+
+def _has_non_finite_float(value: Any) -> bool:
+    """Check whether a JSON-shaped value contains NaN or +/-Infinity anywhere"""
+    stack = [value]
+    while stack:
+        node = stack.pop()
+        node_type = type(node)
+        if node_type is float:
+            if not math.isfinite(node):
+                return True
+        elif node_type is dict:
+            stack.extend(node.values())
+        elif node_type is list:
+            stack.extend(node)
+    return False
+
+
+def make_json_copier(template: Any) -> Callable[[], Any]:
+    """
+    Return a function that makes fresh copies of template.
+    
+    With orjson the template is serialized once and each copy is a single
+    orjson.loads call. orjson raises on values it cannot encode (integers
+    wider than 64 bits, non-string keys) but silently writes NaN and
+    +/-Infinity as null, so templates holding those are checked for up front;
+    both cases fall back to copy_json.
+    """
+    if orjson is not None and not _has_non_finite_float(template):
+        try:
+            encoded = orjson.dumps(template)
+        except orjson.JSONEncodeError:
+            pass
+        else:
+            return lambda: orjson.loads(encoded)
+    return lambda: copy_json(template)
+
+
+UUID_POOL_BATCH_SIZE = 256
 
 
 class PayloadScaler:
@@ -23,25 +142,33 @@ class PayloadScaler:
             'deployment_create_list',  # Same count as services
         }
         
+        # Fresh UUIDs are handed out from a pool refilled UUID_POOL_BATCH_SIZE
+        # at a time, one os.urandom call per refill instead of one per UUID
+        self._uuid_pool = []
+        
+    def next_uuid(self) -> str:
+        """Get a fresh random UUID string"""
+        while True:
+            try:
+                # list.pop is atomic, so concurrent requests never share a UUID
+                return self._uuid_pool.pop()
+            except IndexError:
+                self._uuid_pool.extend(new_uuid_batch(UUID_POOL_BATCH_SIZE))
+                
     def is_id_field(self, field_name: str) -> bool:
         """Check if a field name represents an ID field"""
-        id_patterns = [
-            r'.*_?id$', r'.*_?uuid$', r'.*_?guid$', r'.*_?key$',
-            r'^id$', r'^uuid$', r'^guid$', r'^key$'
-        ]
-        return any(re.match(pattern, field_name, re.IGNORECASE) for pattern in id_patterns)
+        return _is_id_field_name(field_name)
         
     def is_uuid_like(self, value: Any) -> bool:
         """Check if a value looks like a UUID"""
         if not isinstance(value, str):
             return False
-        uuid_pattern = r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$'
-        return bool(re.match(uuid_pattern, value, re.IGNORECASE))
+        return _is_uuid_string(value)
         
     def generate_new_id(self, original_value: Any, index: int) -> Any:
         """Generate a new ID based on the original value and index"""
         if self.is_uuid_like(original_value):
-            return str(uuid.uuid4())
+            return self.next_uuid()
         elif isinstance(original_value, int):
             return original_value + index
         elif isinstance(original_value, str):
@@ -52,52 +179,6 @@ class PayloadScaler:
         else:
             return f"{original_value}_{index + 1}"
             
-    def collect_all_id_values(self, data: Any, path: str = "", id_values: Dict[str, Set[Any]] = None) -> Dict[str, Set[Any]]:
-        """Collect all ID values from the payload"""
-        if id_values is None:
-            id_values = {}
-            
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                if self.is_id_field(key) and value is not None:
-                    if current_path not in id_values:
-                        id_values[current_path] = set()
-                    id_values[current_path].add(value)
-                else:
-                    self.collect_all_id_values(value, current_path, id_values)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                self.collect_all_id_values(item, current_path, id_values)
-                
-        return id_values
-        
-    def find_references(self, data: Any, id_values: Dict[str, Set[Any]], path: str = "", references: Dict[str, List[str]] = None) -> Dict[str, List[str]]:
-        """Find all references to ID values in the payload"""
-        if references is None:
-            references = {}
-            
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                # Check if this value references any known ID
-                if value is not None:
-                    for id_path, id_set in id_values.items():
-                        if value in id_set and current_path != id_path:
-                            if id_path not in references:
-                                references[id_path] = []
-                            references[id_path].append(current_path)
-                            
-                self.find_references(value, id_values, current_path, references)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                self.find_references(item, id_values, current_path, references)
-                
-        return references
-        
     def get_non_scalable_entities(self, api_type: str = 'blueprint') -> set:
         """Get entities that should not be scaled"""
         if api_type == 'blueprint':
@@ -114,28 +195,38 @@ class PayloadScaler:
             
         non_scalable = self.get_non_scalable_entities(api_type)
         
-        if isinstance(data, dict):
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                if isinstance(value, list) and len(value) > 0:
-                    # Skip non-scalable entities
-                    if current_path in non_scalable:
+        # Pre-order walk with an explicit stack (children pushed in reverse) so
+        # entities are recorded in the same order a recursive descent finds them.
+        # Each work item records whether the node is the value of a dict key,
+        # since only those arrays are entities.
+        stack = [(data, path, False)]
+        while stack:
+            obj, obj_path, is_key_value = stack.pop()
+            obj_type = type(obj)
+            if obj_type is dict:
+                children = []
+                for key, value in obj.items():
+                    value_type = type(value)
+                    if value_type not in JSON_CONTAINER_TYPES:
+                        # Nothing to find below a scalar, skip building its path
                         continue
-                        
+                    current_path = f"{obj_path}.{key}" if obj_path else key
+                    
+                    # Skip non-scalable entities (and everything below them)
+                    if value_type is list and value and current_path in non_scalable:
+                        continue
+                    children.append((value, current_path, True))
+                stack.extend(reversed(children))
+            elif obj_type is list:
+                if is_key_value and len(obj) > 0:
                     # This is a potential entity to scale
-                    entities[current_path] = {
-                        'current_count': len(value),
-                        'sample_item': value[0] if value else None,
-                        'full_path': current_path
+                    entities[obj_path] = {
+                        'current_count': len(obj),
+                        'sample_item': obj[0],
+                        'full_path': obj_path
                     }
-                    
-                # Recursively search in nested structures
-                self.find_entities_in_payload(value, current_path, entities, api_type)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                current_path = f"{path}[{i}]"
-                self.find_entities_in_payload(item, current_path, entities, api_type)
+                stack.extend(reversed([(item, f"{obj_path}[{i}]", False) for i, item in enumerate(obj)
+                                       if type(item) in JSON_CONTAINER_TYPES]))
                 
         return entities
         
@@ -198,38 +289,141 @@ class PayloadScaler:
             self.logger.info("DEBUG: Using existing full entity_counts format")
             return user_input
             
+    def get_entity_path_prefixes(self, entity_counts: Dict[str, int]) -> Set[str]:
+        """Get every ancestor path of the entity paths being scaled"""
+        prefixes = set()
+        for entity_path in entity_counts:
+            for i, char in enumerate(entity_path):
+                if char in '.[':
+                    prefixes.add(entity_path[:i])
+        return prefixes
+        
+    def get_entity_path_children(self, entity_paths: Set[str]) -> Dict[str, Set[Any]]:
+        """
+        Map each container path to the child keys (or list indices) that can
+        lead to one of entity_paths.
+        
+        The result is a superset: callers still check the full child path.
+        """
+        children = {}
+        for entity_path in entity_paths:
+            # A top-level key is its own path
+            children.setdefault("", set()).add(entity_path)
+            for i, char in enumerate(entity_path):
+                if char == '.':
+                    children.setdefault(entity_path[:i], set()).add(entity_path[i + 1:])
+            if entity_path.endswith(']'):
+                open_bracket = entity_path.rfind('[')
+                index = entity_path[open_bracket + 1:-1]
+                if open_bracket != -1 and index.isdigit():
+                    children.setdefault(entity_path[:open_bracket], set()).add(int(index))
+        return children
+        
     def scale_payload(self, data: Any, entity_counts: Dict[str, int], path: str = "") -> Any:
-        """Scale payload based on entity counts"""
-        if isinstance(data, dict):
-            result = {}
-            for key, value in data.items():
-                current_path = f"{path}.{key}" if path else key
-                
-                if isinstance(value, list) and current_path in entity_counts:
-                    target_count = entity_counts[current_path]
-                    if len(value) > 0 and target_count > 0:
-                        # Scale the array
-                        template_item = value[0]
-                        scaled_array = []
-                        for i in range(target_count):
-                            new_item = copy.deepcopy(template_item)
-                            # Regenerate IDs in the new item
-                            new_item = self.regenerate_all_ids_in_object(new_item, i, {}, current_path)
-                            scaled_array.append(new_item)
-                        result[key] = scaled_array
-                    else:
-                        result[key] = value
-                else:
-                    result[key] = self.scale_payload(value, entity_counts, current_path)
-            return result
-        elif isinstance(data, list):
-            return [self.scale_payload(item, entity_counts, f"{path}[{i}]") for i, item in enumerate(data)]
+        """
+        Scale payload based on entity counts.
+        
+        Only containers on the way to an entity path are copied; subtrees that
+        no entity path passes through are shared with the input payload.
+        
+        The result therefore aliases data: later in-place edits of the result
+        (live UUIDs, name suffixes on unscaled lists, update_metadata_uuid,
+        update_spec_name) also change data. Callers that keep using data must
+        pass a copy; app.py reads the template from disk on every request.
+        """
+        entity_path_prefixes = self.get_entity_path_prefixes(entity_counts)
+        # Containers on the way are copied shallowly in C and only the keys
+        # that can lead to an entity path are visited, not every key
+        child_keys_by_path = self.get_entity_path_children(entity_path_prefixes.union(entity_counts))
+        
+        # Walk the payload with an explicit stack. Each work item carries the
+        # container slot its copy must be written to.
+        root = [data]
+        stack = [(root, 0, data, path)]
+        
+        while stack:
+            parent, slot, node, node_path = stack.pop()
+            child_keys = child_keys_by_path.get(node_path, ())
+            node_type = type(node)
+            
+            if node_type is dict:
+                result = dict(node)
+                parent[slot] = result
+                for key in child_keys:
+                    # One lookup; a missing key gives None, which is skipped with the scalars
+                    value = node.get(key)
+                    value_type = type(value)
+                    if value_type not in JSON_CONTAINER_TYPES:
+                        continue
+                        
+                    current_path = f"{node_path}.{key}" if node_path else key
+                    
+                    target_count = entity_counts.get(current_path) if value_type is list else None
+                    if target_count is not None:
+                        if len(value) > 0 and target_count > 0:
+                            # Scale the array
+                            template_item = value[0]
+                            # Every copy of the template shares the same ID-free
+                            # subtrees, so find them once rather than per copy
+                            id_free_nodes = set()
+                            self.find_id_free_nodes(template_item, id_free_nodes)
+                            scaled_array = []
+                            for i in range(target_count):
+                                # Regenerating IDs rebuilds every dict/list, so the
+                                # result is already an independent copy of the template
+                                new_item = self.regenerate_all_ids_in_object(template_item, i, None, current_path, id_free_nodes)
+                                scaled_array.append(new_item)
+                            result[key] = scaled_array
+                    elif current_path in entity_path_prefixes:
+                        stack.append((result, key, value, current_path))
+            elif node_type is list:
+                result = list(node)
+                parent[slot] = result
+                node_length = len(node)
+                for i in child_keys:
+                    if type(i) is int and i < node_length and type(node[i]) in JSON_CONTAINER_TYPES:
+                        item_path = f"{node_path}[{i}]"
+                        if item_path in entity_path_prefixes:
+                            stack.append((result, i, node[i], item_path))
+                        
+        return root[0]
+            
+    def find_id_free_nodes(self, obj: Any, id_free_nodes: Set[int]) -> bool:
+        """Record the id() of every container whose subtree holds no ID fields"""
+        id_free = True
+        obj_type = type(obj)
+        if obj_type is dict:
+            for key, value in obj.items():
+                if self.is_id_field(key) and value is not None:
+                    id_free = False
+                elif not self.find_id_free_nodes(value, id_free_nodes):
+                    id_free = False
+        elif obj_type is list:
+            for item in obj:
+                if not self.find_id_free_nodes(item, id_free_nodes):
+                    id_free = False
         else:
-            return data
+            return True
+            
+        if id_free:
+            id_free_nodes.add(id(obj))
+        return id_free
+        
+    def regenerate_all_ids_in_object(self, obj: Any, index: int, id_mapping: Optional[Dict], base_path: str, id_free_nodes: Set[int] = None) -> Any:
+        """
+        Regenerate all ID fields in an object.
+        
+        Pass id_mapping=None when the old -> new mapping is not needed; paths
+        are then never built for the nodes visited.
+        """
+        if id_free_nodes and id(obj) in id_free_nodes:
+            # Nothing to regenerate below here, a plain copy is enough. These
+            # subtrees are small, where an orjson round-trip costs more than it saves
+            return copy_json(obj)
             
-    def regenerate_all_ids_in_object(self, obj: Any, index: int, id_mapping: Dict, base_path: str) -> Any:
-        """Regenerate all ID fields in an object"""
-        if isinstance(obj, dict):
+        track = id_mapping is not None
+        obj_type = type(obj)
+        if obj_type is dict:
             result = {}
             for key, value in obj.items():
                 if self.is_id_field(key) and value is not None:
@@ -238,105 +432,127 @@ class PayloadScaler:
                     result[key] = new_id
                     
                     # Track mapping
-                    full_path = f"{base_path}.{key}"
-                    if full_path not in id_mapping:
-                        id_mapping[full_path] = {}
-                    id_mapping[full_path][value] = new_id
+                    if track:
+                        id_mapping.setdefault(f"{base_path}.{key}", {})[value] = new_id
                 else:
-                    result[key] = self.regenerate_all_ids_in_object(value, index, id_mapping, f"{base_path}.{key}")
+                    child_path = f"{base_path}.{key}" if track else base_path
+                    result[key] = self.regenerate_all_ids_in_object(value, index, id_mapping, child_path, id_free_nodes)
             return result
-        elif isinstance(obj, list):
-            return [self.regenerate_all_ids_in_object(item, index, id_mapping, f"{base_path}[{i}]") for i, item in enumerate(obj)]
+        elif obj_type is list:
+            return [
+                self.regenerate_all_ids_in_object(item, index, id_mapping, f"{base_path}[{i}]" if track else base_path, id_free_nodes)
+                for i, item in enumerate(obj)
+            ]
         else:
             return obj
             
+    def build_entity_path_trie(self, entity_counts: Dict[str, int]) -> Dict[Any, Any]:
+        """Merge entity paths into a trie of path parts; a None key marks the end of a path"""
+        trie = {}
+        for entity_path in entity_counts:
+            node = trie
+            for part in _split_path(entity_path):
+                node = node.setdefault(part, {})
+            node[None] = True
+        return trie
+        
     def add_name_suffix_to_entities(self, data: Any, entity_counts: Dict[str, int]) -> Any:
-        """Add numeric suffixes to entity names"""
-        def add_suffix_at_path(obj, remaining_parts, indices=None):
-            if indices is None:
-                indices = {}
-                
-            if not remaining_parts:
-                return obj
-                
-            if isinstance(obj, dict):
-                part = remaining_parts[0]
-                if part in obj:
-                    if len(remaining_parts) == 1:
-                        # This is the target array
-                        if isinstance(obj[part], list):
-                            for i, item in enumerate(obj[part]):
-                                if isinstance(item, dict) and 'name' in item:
-                                    original_name = item['name']
-                                    if not original_name.endswith(f'_{i + 1}'):
-                                        item['name'] = f"{original_name}_{i + 1}"
-                    else:
-                        obj[part] = add_suffix_at_path(obj[part], remaining_parts[1:], indices)
-            elif isinstance(obj, list):
-                return [add_suffix_at_path(item, remaining_parts, indices) for item in obj]
-                
-            return obj
-            
-        result = copy.deepcopy(data)
-        for entity_path in entity_counts.keys():
-            parts = entity_path.split('.')
-            result = add_suffix_at_path(result, parts)
+        """
+        Add numeric suffixes to entity names.
+        
+        Names are updated in place.
+        """
+        if not entity_counts:
+            # No entity was scaled, so no names need a suffix
+            return data
             
-        return result
+        def add_suffix_to_items(target):
+            if type(target) is list:
+                for i, item in enumerate(target, 1):
+                    if type(item) is dict and 'name' in item:
+                        original_name = item['name']
+                        suffix = f'_{i}'
+                        if not original_name.endswith(suffix):
+                            item['name'] = original_name + suffix
+                            
+        # All entity paths are followed in one walk: shared prefixes such as
+        # spec.resources are visited once instead of once per entity path
+        stack = [(data, self.build_entity_path_trie(entity_counts))]
+        while stack:
+            node, trie_node = stack.pop()
+            node_type = type(node)
+            if node_type is list:
+                # Lists are transparent: their items match the same path part
+                stack.extend((item, trie_node) for item in node if type(item) in JSON_CONTAINER_TYPES)
+            elif node_type is dict:
+                for part, child_trie in trie_node.items():
+                    # One lookup; the None end-of-path marker is never a payload key,
+                    # and a None value has nothing to suffix or walk into
+                    child = node.get(part)
+                    if child is None:
+                        continue
+                    if None in child_trie:
+                        # A full entity path ends here, so this is a target array
+                        add_suffix_to_items(child)
+                    if len(child_trie) > 1 or None not in child_trie:
+                        stack.append((child, child_trie))
+                        
+        return data
         
     def update_spec_name(self, data: Any) -> Any:
         """Update the spec name with timestamp"""
-        if isinstance(data, dict) and 'spec' in data and 'name' in data['spec']:
+        # Generated payloads always carry spec.name, so look it up directly
+        try:
             original_name = data['spec']['name']
+        except (KeyError, TypeError):
+            return data
             
-            # Check if name already has a timestamp pattern (avoid duplication)
-            timestamp_pattern = r'_\d{8}_\d{6}$'
-            if re.search(timestamp_pattern, original_name):
-                # Name already has timestamp, don't modify it
-                self.logger.info(f"Spec name already has timestamp: {original_name}")
-                return data
+        # Check if name already has a timestamp pattern (avoid duplication)
+        if SPEC_NAME_TIMESTAMP_PATTERN.search(original_name):
+            # Name already has timestamp, don't modify it
+            self.logger.info(f"Spec name already has timestamp: {original_name}")
+            return data
             
-            # Add scaled prefix and timestamp for names without timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            data['spec']['name'] = f"scaled_{original_name}_{timestamp}"
+        # Add scaled prefix and timestamp for names without timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        data['spec']['name'] = f"scaled_{original_name}_{timestamp}"
         return data
         
     def update_metadata_uuid(self, data: Any) -> Any:
         """Update metadata UUID"""
-        if isinstance(data, dict) and 'metadata' in data and isinstance(data['metadata'], dict):
-            if 'uuid' in data['metadata']:
-                data['metadata']['uuid'] = str(uuid.uuid4())
+        try:
+            metadata = data['metadata']
+            if 'uuid' in metadata:
+                metadata['uuid'] = self.next_uuid()
+        except (KeyError, TypeError):
+            pass
         return data
         
     def regenerate_all_entity_uuids(self, data: Any) -> Any:
-        """Regenerate all entity UUIDs in the payload"""
+        """Regenerate all entity UUIDs in the payload (in place)"""
         uuid_mapping = {}
         
-        def get_new_uuid(old_uuid: str) -> str:
-            if old_uuid not in uuid_mapping:
-                uuid_mapping[old_uuid] = str(uuid.uuid4())
-            return uuid_mapping[old_uuid]
-            
-        def regenerate_all_uuids(obj: Any) -> Any:
-            if isinstance(obj, dict):
-                result = {}
-                for key, value in obj.items():
-                    if key == 'uuid' and isinstance(value, str) and self.is_uuid_like(value):
-                        result[key] = get_new_uuid(value)
-                    else:
-                        result[key] = regenerate_all_uuids(value)
-                return result
-            elif isinstance(obj, list):
-                return [regenerate_all_uuids(item) for item in obj]
-            else:
-                return obj
-        
-        # Regenerate all UUIDs first
-        result = regenerate_all_uuids(data)
-        
+        # UUIDs are rewritten in place, so no container is rebuilt
+        stack = [data]
+        while stack:
+            node = stack.pop()
+            if type(node) is dict:
+                for key, value in node.items():
+                    if key == 'uuid' and type(value) is str:
+                        # Look the old UUID up first; only unseen values need the format check
+                        new_uuid = uuid_mapping.get(value)
+                        if new_uuid is None and self.is_uuid_like(value):
+                            new_uuid = uuid_mapping[value] = self.next_uuid()
+                        if new_uuid is not None:
+                            node[key] = new_uuid
+                    elif type(value) in JSON_CONTAINER_TYPES:
+                        stack.append(value)
+            elif type(node) is list:
+                stack.extend(item for item in node if type(item) in JSON_CONTAINER_TYPES)
+                
         # Fix client_attrs to use new deployment UUIDs
-        if isinstance(result, dict) and 'spec' in result:
-            resources = result.get('spec', {}).get('resources', {})
+        if isinstance(data, dict) and 'spec' in data:
+            resources = data.get('spec', {}).get('resources', {})
             if 'client_attrs' in resources and 'app_profile_list' in resources:
                 # Collect all current deployment UUIDs
                 current_deployment_uuids = []
@@ -345,20 +561,15 @@ class PayloadScaler:
                         if 'uuid' in deployment:
                             current_deployment_uuids.append(deployment['uuid'])
                 
-                # Get old client_attrs keys (these are the old deployment UUIDs)
+                # Old client_attrs keys are the old deployment UUIDs, in deployment order
                 old_client_attrs = resources['client_attrs']
-                old_deployment_uuids = list(old_client_attrs.keys())
                 
                 # If we have the same number of deployments, map old to new
-                if len(current_deployment_uuids) == len(old_deployment_uuids):
-                    new_client_attrs = {}
-                    for i, new_uuid in enumerate(current_deployment_uuids):
-                        if i < len(old_deployment_uuids):
-                            old_uuid = old_deployment_uuids[i]
-                            # Copy the position from old to new UUID
-                            new_client_attrs[new_uuid] = old_client_attrs[old_uuid]
+                if len(current_deployment_uuids) == len(old_client_attrs):
+                    # Copy each position from old to new UUID in a single pass over the values
+                    new_client_attrs = dict(zip(current_deployment_uuids, old_client_attrs.values()))
                     
                     resources['client_attrs'] = new_client_attrs
                     self.logger.info(f"Updated client_attrs with {len(new_client_attrs)} new deployment UUIDs")
                 
-        return result
+        return data
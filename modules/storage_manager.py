@@ -5,7 +5,6 @@ Handles file storage, rules management, and history tracking
 
 import os
 import json
-import copy
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
@@ -23,6 +22,9 @@ class StorageManager:
         self.history_dir = os.path.join(base_dir, 'history')
         self.api_rules_file = os.path.join(base_dir, 'api_rules.json')
         
+        # Parsed default rules keyed by file path, with the mtime they were read at
+        self._default_rules_cache = {}
+        
         # Create necessary directories
         os.makedirs(self.history_dir, exist_ok=True)
         
@@ -38,23 +40,36 @@ class StorageManager:
         return os.path.join(self.rules_dir, api_type)
         
     def load_default_rules(self, api_type: str) -> Dict[str, Any]:
-        """Load default rules for an API type"""
+        """
+        Load default rules for an API type.
+        
+        Parsed rules are cached per file and only re-read when the file's
+        modification time changes. Callers must treat the result as read-only.
+        """
         rules_path = self.get_rules_path(api_type)
         default_rules_file = os.path.join(rules_path, 'default_rules.json')
         
-        if os.path.exists(default_rules_file):
-            try:
-                with open(default_rules_file, 'r', encoding='utf-8') as f:
-                    rules = json.load(f)
-                    self.logger.info(f"Loaded default rules for {api_type} from {default_rules_file}")
-                    return rules
-            except Exception as e:
-                self.logger.error(f"Error loading default rules for {api_type}: {e}")
-                return {}
-        else:
+        try:
+            modified_ns = os.stat(default_rules_file).st_mtime_ns
+        except OSError:
             self.logger.warning(f"No default rules file found for {api_type} at {default_rules_file}")
             return {}
             
+        cached = self._default_rules_cache.get(default_rules_file)
+        if cached is not None and cached[0] == modified_ns:
+            return cached[1]
+            
+        try:
+            with open(default_rules_file, 'r', encoding='utf-8') as f:
+                rules = json.load(f)
+                self.logger.info(f"Loaded default rules for {api_type} from {default_rules_file}")
+        except Exception as e:
+            self.logger.error(f"Error loading default rules for {api_type}: {e}")
+            return {}
+            
+        self._default_rules_cache[default_rules_file] = (modified_ns, rules)
+        return rules
+            
     def load_api_rules(self) -> Dict[str, Any]:
         """Load all API rules from storage"""
         if os.path.exists(self.api_rules_file):
@@ -85,12 +100,14 @@ class StorageManager:
         """Save a complete rule set for an API"""
         all_rules = self.load_api_rules()
         
+        # A new rule set is created and last updated at the same moment
+        now = datetime.now().isoformat()
         rule_set = {
             'api_type': api_type,
             'rules': rules,
             'task_execution': task_execution,
-            'created_at': datetime.now().isoformat(),
-            'updated_at': datetime.now().isoformat()
+            'created_at': now,
+            'updated_at': now
         }
         
         if payload_template is not None:
@@ -206,16 +223,17 @@ class StorageManager:
         """Add entry to entity history with FIFO management"""
         history = self.load_entity_history(entity_name)
         
-        # Create new entry
+        # Create new entry. The entry is written to disk below and never kept
+        # in memory, so the rules and template are serialized as-is, not copied
         new_entry = {
             "timestamp": datetime.now().isoformat(),
-            "rules": copy.deepcopy(rule_data.get('rules', [])),
+            "rules": rule_data.get('rules', []),
             "api_type": rule_data.get('api_type', 'unknown'),
             "task_execution": rule_data.get('task_execution', 'parallel')
         }
         
         if payload_template is not None:
-            new_entry["payload_template"] = copy.deepcopy(payload_template)
+            new_entry["payload_template"] = payload_template
             
         # Add to beginning
         history.insert(0, new_entry)